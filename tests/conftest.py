@@ -1,11 +1,41 @@
 import pytest
 
+from django.apps import apps
 from django.contrib.postgres.signals import register_type_handlers
 from django.db import connection
 
 from .fake_model import define_fake_app
 
 
+@pytest.fixture(scope="session")
+def _registered_models():
+    """Snapshots the models registered in the app registry before any of the
+    tests define fake models."""
+
+    return {
+        app_label: set(models) for app_label, models in apps.all_models.items()
+    }
+
+
+@pytest.fixture(scope="function", autouse=True)
+def _purge_fake_models(_registered_models):
+    """Unregisters fake models defined by previous tests.
+
+    This keeps the app registry from growing with every test, which
+    would make building project states increasingly slow.
+    """
+
+    purged = False
+    for app_label, models in list(apps.all_models.items()):
+        registered = _registered_models.get(app_label, set())
+        for model_name in set(models) - registered:
+            del models[model_name]
+            purged = True
+
+    if purged:
+        apps.clear_cache()
+
+
 @pytest.fixture(scope="function", autouse=True)
 def database_access(db):
     """Automatically enable database access for all tests."""
@@ -1,6 +1,5 @@
 from contextlib import contextmanager
-from typing import List
-from unittest import mock
+from typing import Dict, List
 
 from django.apps import apps
 from django.db import connection, migrations
@@ -14,30 +13,101 @@ from psqlextra.backend.schema import PostgresSchemaEditor
 
 from .fake_model import define_fake_model
 
+# migration executors, keyed by the connection they
+# were created for; fake models and apps have no
+# migrations, so they don't affect the loaded graph
+_EXECUTOR_CACHE: Dict[int, MigrationExecutor] = {}
+
+
+def _get_executor(conn) -> MigrationExecutor:
+    """Gets a migration executor for the specified connection.
+
+    Creating an executor loads the entire migration graph, so it is
+    only done once for every connection.
+    """
+
+    executor = _EXECUTOR_CACHE.get(id(conn))
+    if executor is None:
+        executor = MigrationExecutor(conn)
+        _EXECUTOR_CACHE[id(conn)] = executor
+
+    return executor
+
 
 @contextmanager
 def filtered_schema_editor(*filters: List[str]):
     """Gets a schema editor, but filters executed SQL statements based on the
     specified text filters.
 
+    Statements are matched against the filters as they are
+    executed by any schema editor. For every filter, a list of
+    `(sql, params)` tuples of the matching statements is collected.
+
     Arguments:
         filters:
             List of strings to filter SQL
             statements on.
     """
 
-    with connection.schema_editor() as schema_editor:
-        wrapper_for = schema_editor.execute
-        with mock.patch.object(
-            PostgresSchemaEditor, "execute", wraps=wrapper_for
-        ) as execute:
-            filter_results = {}
+    filter_results = {filter_text: [] for filter_text in filters}
+
+    original_execute = PostgresSchemaEditor.execute
+    is_own_execute = "execute" in PostgresSchemaEditor.__dict__
+
+    def _tap(self, sql, *args, **kwargs):
+        params = args[0] if args else kwargs.get("params")
+
+        sql_text = sql if isinstance(sql, str) else str(sql)
+        for filter_text in filters:
+            if filter_text in sql_text:
+                filter_results[filter_text].append((sql, params))
+
+        return original_execute(self, sql, *args, **kwargs)
+
+    with connection.schema_editor():
+        PostgresSchemaEditor.execute = _tap
+
+        try:
             yield filter_results
+        finally:
+            if is_own_execute:
+                PostgresSchemaEditor.execute = original_execute
+            else:
+                del PostgresSchemaEditor.execute
 
-    for filter_text in filters:
-        filter_results[filter_text] = [
-            call for call in execute.mock_calls if filter_text in str(call)
-        ]
+
+def reset_filtered_calls(calls: Dict[str, List]):
+    """Creates a migration operation that discards the statements collected
+    by :see:filtered_schema_editor so far.
+
+    This allows setting up and applying the operations under test in
+    a single migration while only collecting the statements of the
+    operations under test. Statements deferred by the preceding
+    operations are executed before the collected ones are discarded
+    so that they aren't attributed to the operations under test.
+
+    Arguments:
+        calls:
+            The filter results yielded by
+            :see:filtered_schema_editor.
+    """
+
+    def _reset(apps, schema_editor):
+        for sql in schema_editor.deferred_sql:
+            schema_editor.execute(sql)
+
+        schema_editor.deferred_sql = []
+
+        for filtered_calls in calls.values():
+            filtered_calls.clear()
+
+    return migrations.RunPython(_reset)
+
+
+class _TestMigration(migrations.Migration):
+    """Migration used to apply operations with :see:apply_migration."""
+
+    operations = []
 
 
 def apply_migration(operations, state=None, backwards: bool = False):
@@ -59,13 +129,10 @@ def apply_migration(operations, state=None, backwards: bool = False):
 
     state = state or migrations.state.ProjectState.from_apps(apps)
 
-    class Migration(migrations.Migration):
-        pass
+    migration = _TestMigration("migration", "tests")
+    migration.operations = operations
 
-    Migration.operations = operations
-
-    migration = Migration("migration", "tests")
-    executor = MigrationExecutor(connection)
+    executor = _get_executor(connection)
 
     if not backwards:
         executor.apply_migration(state, migration)
@@ -75,13 +142,25 @@ def apply_migration(operations, state=None, backwards: bool = False):
     return migration
 
 
+# whether the history of applied migrations has
+# been checked for consistency already
+_history_checked = False
+
+
 def make_migration(app_label="tests", from_state=None, to_state=None):
     """Generates migrations based on the specified app's state."""
 
+    global _history_checked
+
     app_labels = [app_label]
 
     loader = MigrationLoader(None, ignore_no_migrations=True)
-    loader.check_consistent_history(connection)
+
+    # the applied migrations don't change during the test
+    # session, so the history only has to be checked once
+    if not _history_checked:
+        loader.check_consistent_history(connection)
+        _history_checked = True
 
     questioner = NonInteractiveMigrationQuestioner(
         specified_apps=app_labels, dry_run=False
@@ -121,13 +200,13 @@ def create_drop_model(field, filters: List[str]):
             SQL statements on.
     """
 
-    model = define_fake_model({"title": field})
+    model = define_fake_model()
 
     with filtered_schema_editor(*filters) as calls:
         apply_migration(
             [
                 migrations.CreateModel(
-                    model.__name__, fields=[("title", field.clone())]
+                    model.__name__, fields=[("title", field)]
                 ),
                 migrations.DeleteModel(model.__name__),
             ]
@@ -152,20 +231,16 @@ def alter_db_table(field, filters: List[str]):
     """
 
     model = define_fake_model()
-    state = migrations.state.ProjectState.from_apps(apps)
-
-    apply_migration(
-        [
-            migrations.CreateModel(
-                model.__name__, fields=[("title", field.clone())]
-            )
-        ],
-        state,
-    )
 
     with filtered_schema_editor(*filters) as calls:
         apply_migration(
-            [migrations.AlterModelTable(model.__name__, "NewTableName")], state
+            [
+                migrations.CreateModel(
+                    model.__name__, fields=[("title", field)]
+                ),
+                reset_filtered_calls(calls),
+                migrations.AlterModelTable(model.__name__, "NewTableName"),
+            ]
         )
 
     yield calls
@@ -185,13 +260,14 @@ def add_field(field, filters: List[str]):
     """
 
     model = define_fake_model()
-    state = migrations.state.ProjectState.from_apps(apps)
-
-    apply_migration([migrations.CreateModel(model.__name__, fields=[])], state)
 
     with filtered_schema_editor(*filters) as calls:
         apply_migration(
-            [migrations.AddField(model.__name__, "title", field)], state
+            [
+                migrations.CreateModel(model.__name__, fields=[]),
+                reset_filtered_calls(calls),
+                migrations.AddField(model.__name__, "title", field),
+            ]
         )
 
     yield calls
@@ -210,21 +286,17 @@ def remove_field(field, filters: List[str]):
             SQL statements on.
     """
 
-    model = define_fake_model({"title": field})
-    state = migrations.state.ProjectState.from_apps(apps)
-
-    apply_migration(
-        [
-            migrations.CreateModel(
-                model.__name__, fields=[("title", field.clone())]
-            )
-        ],
-        state,
-    )
+    model = define_fake_model()
 
     with filtered_schema_editor(*filters) as calls:
         apply_migration(
-            [migrations.RemoveField(model.__name__, "title")], state
+            [
+                migrations.CreateModel(
+                    model.__name__, fields=[("title", field)]
+                ),
+                reset_filtered_calls(calls),
+                migrations.RemoveField(model.__name__, "title"),
+            ]
         )
 
     yield calls
@@ -246,21 +318,17 @@ def alter_field(old_field, new_field, filters: List[str]):
             SQL statements on.
     """
 
-    model = define_fake_model({"title": old_field})
-    state = migrations.state.ProjectState.from_apps(apps)
-
-    apply_migration(
-        [
-            migrations.CreateModel(
-                model.__name__, fields=[("title", old_field.clone())]
-            )
-        ],
-        state,
-    )
+    model = define_fake_model()
 
     with filtered_schema_editor(*filters) as calls:
         apply_migration(
-            [migrations.AlterField(model.__name__, "title", new_field)], state
+            [
+                migrations.CreateModel(
+                    model.__name__, fields=[("title", old_field)]
+                ),
+                reset_filtered_calls(calls),
+                migrations.AlterField(model.__name__, "title", new_field),
+            ]
         )
 
     yield calls
@@ -279,21 +347,17 @@ def rename_field(field, filters: List[str]):
             SQL statements on.
     """
 
-    model = define_fake_model({"title": field})
-    state = migrations.state.ProjectState.from_apps(apps)
-
-    apply_migration(
-        [
-            migrations.CreateModel(
-                model.__name__, fields=[("title", field.clone())]
-            )
-        ],
-        state,
-    )
+    model = define_fake_model()
 
     with filtered_schema_editor(*filters) as calls:
         apply_migration(
-            [migrations.RenameField(model.__name__, "title", "newtitle")], state
+            [
+                migrations.CreateModel(
+                    model.__name__, fields=[("title", field)]
+                ),
+                reset_filtered_calls(calls),
+                migrations.RenameField(model.__name__, "title", "newtitle"),
+            ]
         )
 
     yield calls
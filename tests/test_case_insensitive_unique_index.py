@@ -32,7 +32,7 @@ def test_ciui_migrations():
     with filtered_schema_editor("CREATE UNIQUE INDEX") as calls:
         apply_migration(ops)
 
-    sql = str([call[0] for _, call, _ in calls["CREATE UNIQUE INDEX"]][0])
+    sql = str([sql for sql, _ in calls["CREATE UNIQUE INDEX"]][0])
     expected_sql = 'CREATE UNIQUE INDEX "index1" ON "tests_mymodel" (LOWER("name"), LOWER("other_name"))'
     assert sql == expected_sql
 
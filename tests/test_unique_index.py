@@ -26,7 +26,7 @@ def test_unique_index_migrations():
     with filtered_schema_editor("CREATE UNIQUE INDEX") as calls:
         apply_migration(ops)
 
-    calls = [call[0] for _, call, _ in calls["CREATE UNIQUE INDEX"]]
+    calls = [sql for sql, _ in calls["CREATE UNIQUE INDEX"]]
 
     db_table = "tests_mymodel"
     query = 'CREATE UNIQUE INDEX "index1" ON "{0}" ("name", "other_name")'